@@ -9,17 +9,34 @@ Complete Enhanced News Analysis System with Professional Document Generation
 Combines all tools and enhanced document generator into a single working file
 """
 
+import io
 import os
+import sys
+import argparse
 import time
 import json
+import hashlib
+import sqlite3
+import statistics
+import asyncio
+import multiprocessing
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from typing import List, Dict, Any, Optional, Tuple
 from dotenv import load_dotenv
 from ddgs import DDGS
-from openai import OpenAI
-from bs4 import BeautifulSoup
+from ddgs.exceptions import DDGSException
+from openai import OpenAI, AsyncOpenAI
+from bs4 import BeautifulSoup, SoupStrainer, UnicodeDammit
 import re
+from functools import lru_cache
 from docx import Document
 from docx.shared import Inches, Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
@@ -28,6 +45,148 @@ from docx.enum.table import WD_TABLE_ALIGNMENT
 from docx.oxml.shared import OxmlElement, qn
 from docx.oxml import parse_xml
 from docx.oxml.ns import nsdecls
+from xml.sax.saxutils import escape
+
+try:
+    import lxml  # noqa: F401  (C parser backend for BeautifulSoup)
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser  # C parser, much faster than bs4 for plain text extraction
+except ImportError:
+    LexborHTMLParser = None
+
+# Only build the parts of a page that can hold article text
+CONTENT_STRAINER = SoupStrainer(["article", "main", "div", "p", "section"])
+_CONTENT_CLASS_RE = re.compile(r"^(content|post-content|entry-content|article-body|story-body)$")
+_CONTENT_CLASS_SELECTOR = ".content, .post-content, .entry-content, .article-body, .story-body"
+_NOISE_TAGS = ["script", "style", "nav", "footer", "header", "aside"]
+_WS_RE = re.compile(r"\s+")
+_NETLOC_RE = re.compile(r"https?://([^/?#]+)", re.I)
+
+# Hosts whose pages need a login or JavaScript, so scraping them only wastes a request
+_SKIP_HOSTS = {"twitter.com", "x.com", "facebook.com", "instagram.com", "youtube.com"}
+
+
+# Query parameters that only track the click and never change the page
+_TRACKING_PARAMS = {"fbclid", "gclid", "dclid", "msclkid", "mc_cid", "mc_eid", "ocid", "cmpid", "smid", "ref_src"}
+_AMP_PATH_RE = re.compile(r"/amp/?$|\.amp(?=(?:\.html?)?$)")
+
+
+def _normalize_url(url: str) -> str:
+    """Canonical form of a URL for de-duplication: lowercase scheme/host, no fragment, no tracking
+    parameters and the regular page instead of its AMP copy. A leading www. or amp. is dropped
+    only when at least two host labels remain, so amp.dev stays amp.dev."""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith(("www.", "amp.")) and "." in host[4:]:
+        host = host[4:]
+    path = _AMP_PATH_RE.sub("", parts.path)
+    query = parts.query
+    if query:
+        query = urlencode([
+            (k, v) for k, v in parse_qsl(query, keep_blank_values=True)
+            if not k.lower().startswith("utm_") and k.lower() not in _TRACKING_PARAMS
+            and not (k.lower() in ("amp", "outputtype") and v.lower() in ("", "1", "amp"))
+        ])
+    return urlunsplit((parts.scheme.lower(), host, path, query, ""))
+
+
+def _is_skipped_host(url: str) -> bool:
+    host = urlsplit(url).hostname or ""
+    return any(host == h or host.endswith("." + h) for h in _SKIP_HOSTS)
+
+
+def _extract_text_selectolax(html: str) -> str:
+    """Pull the main article text out of a page with selectolax"""
+    tree = LexborHTMLParser(html)
+    for tag in tree.css(", ".join(_NOISE_TAGS)):
+        tag.decompose()
+
+    node = (
+        tree.css_first("article")
+        or tree.css_first('[role="main"]')
+        or tree.css_first(_CONTENT_CLASS_SELECTOR)
+        or tree.css_first("main")
+    )
+    text = node.text(separator=" ", strip=True) if node else ""
+
+    if not text:
+        text = ' '.join([p.text(separator=" ", strip=True) for p in tree.css("p")])
+    return text
+
+
+def _extract_text_bs4(html: str) -> str:
+    """Pull the main article text out of a page with BeautifulSoup"""
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=CONTENT_STRAINER)
+
+    # Top-level <script>/<nav>/... never enter the tree, but they can
+    # still be nested inside a kept container
+    for script in soup(_NOISE_TAGS):
+        script.decompose()
+
+    node = (
+        soup.find("article")
+        or soup.find(attrs={"role": "main"})
+        or soup.find(class_=_CONTENT_CLASS_RE)
+        or soup.find("main")
+    )
+    text = node.get_text(" ", strip=True) if node else ""
+
+    if not text:
+        # str.join materializes its input anyway, so a list comp beats a generator here
+        text = ' '.join([p.get_text(" ", strip=True) for p in soup.find_all('p')])
+    return text
+
+
+def _extract_text_with_fallback(html: str) -> str:
+    """selectolax first; BeautifulSoup gets a second look at pages it can't read or finds empty"""
+    try:
+        text = _extract_text_selectolax(html)
+    except Exception:
+        text = ""
+    return text or _extract_text_bs4(html)
+
+
+extract_article_text = _extract_text_with_fallback if LexborHTMLParser else _extract_text_bs4
+
+
+_CHARSET_RE = re.compile(r"charset=[\"']?([\w.:-]+)", re.I)
+
+
+def _decode_html(html: bytes, encoding: Optional[str] = None) -> str:
+    """Decode a page: the HTTP charset if it works, else a BOM, <meta charset> or a sniffed encoding.
+
+    lexbor ignores <meta charset> and reads bytes as UTF-8, so pages are decoded before parsing.
+    """
+    return UnicodeDammit(html, [encoding] if encoding else [], is_html=True).unicode_markup or ""
+
+
+def _article_text(html: bytes, encoding: Optional[str] = None) -> Tuple[str, int]:
+    """Whitespace-normalized article text of a page, at most about 3000 characters, and its word count
+    (picklable for process pools).
+
+    encoding is the charset from the Content-Type header, if it had one. Long pages keep their
+    opening and their last paragraphs, cut at word boundaries, so the summary sees the lede and
+    the conclusion; the " ... " between them is not counted as a word.
+    """
+    text = _WS_RE.sub(' ', extract_article_text(_decode_html(html, encoding))).strip()
+    if not text:
+        return "", 0
+    # The text is whitespace-normalized, so spaces + 1 is the word count
+    if len(text) <= 3000:
+        return text, text.count(" ") + 1
+    head = text[:2000] if text[2000] == " " else text[:2000].rsplit(" ", 1)[0]
+    tail = text[-1000:] if text[-1001] == " " else text[-1000:].split(" ", 1)[-1]
+    return head + " ... " + tail, head.count(" ") + tail.count(" ") + 2
+
 
 # Load environment variables
 load_dotenv()
@@ -38,6 +197,124 @@ if not OPENAI_API_KEY:
 
 client = OpenAI(api_key=OPENAI_API_KEY) if OPENAI_API_KEY else None
 
+# Per-article summaries are high-volume and simple, so they get the cheaper, faster model
+SUMMARY_MODEL = os.getenv("SUMMARY_MODEL", "gpt-4o-mini")
+REPORT_MODEL = os.getenv("REPORT_MODEL", "gpt-4o")
+
+# Prompt input budgets, in tokens rather than characters
+SUMMARY_INPUT_TOKENS = 1500
+REPORT_INPUT_TOKENS = 8000
+
+# Finished pipeline runs are kept on disk and reused for this long (seconds)
+RESULT_CACHE_PATH = os.getenv("NEWS_CACHE_PATH", ".news_cache.sqlite3")
+RESULT_CACHE_TTL = 6 * 3600
+
+# In-process reuse windows for the agent's connectivity check, search results and scraped articles (seconds)
+CONNECTIVITY_TTL = 30
+SEARCH_TTL = 15 * 60
+SCRAPE_TTL = 60 * 60
+
+# Entries kept in the agent's in-memory caches; a long interactive session would otherwise grow them forever
+SEARCH_CACHE_SIZE = 64
+SCRAPE_CACHE_SIZE = 512
+
+
+@lru_cache(maxsize=None)
+def _encoding(model: str):
+    """tiktoken encoding for a model, or None when tiktoken or its BPE files are unavailable"""
+    if tiktoken is None:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        return None
+
+
+def _truncate_tokens(text: str, max_tokens: int, model: str = SUMMARY_MODEL) -> str:
+    """Cut text down to at most max_tokens tokens for the given model"""
+    enc = _encoding(model)
+    if enc is None:
+        return text[:max_tokens * 4]  # roughly 4 characters per English token
+    ids = enc.encode(text, disallowed_special=())
+    if len(ids) <= max_tokens:
+        return text
+    return enc.decode(ids[:max_tokens])
+
+
+_SUMMARY_TEMPLATE = """Summarize this news article concisely:
+
+Title: {title}
+
+Content: {content}
+
+Provide a clear, factual summary in 3-4 sentences focusing on:
+1. Main news/event
+2. Key details and facts
+3. Any important implications or context"""
+
+_REPORT_TEMPLATE = """Create a comprehensive news analysis report based on these article summaries:
+
+Topic: {topic}
+Number of articles analyzed: {article_count}
+
+{combined_content}
+
+Generate a professional report with:
+1. **Executive Summary** - Key findings and trends
+2. **Major Themes** - Common topics and patterns
+3. **Key Developments** - Most important news items
+4. **Analysis & Insights** - What these developments mean
+5. **Sources Summary** - Brief overview of sources used
+
+Format as a clear, well-structured report suitable for executive briefing."""
+
+# Longest a server's Retry-After may make us wait before retrying (seconds)
+MAX_RETRY_AFTER = 10.0
+
+
+class _CappedRetry(Retry):
+    """Retry that honours Retry-After on 429/503 but never sleeps longer than MAX_RETRY_AFTER"""
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, MAX_RETRY_AFTER)
+
+
+# Shared HTTP session so every fetch reuses pooled keep-alive connections
+def build_http_session(pool_connections: int = 64, pool_maxsize: int = 32, retries: int = 3) -> requests.Session:
+    """Session with the scraper User-Agent, retries on transient errors and a connection pool per host.
+
+    pool_connections is how many hosts keep pooled connections, pool_maxsize how many per host;
+    retries=0 disables retrying altogether.
+    """
+    session = requests.Session()
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    })
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=_CappedRetry(total=retries, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504])
+        if retries else 0
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Default for tools created without an explicit session
+SESSION = build_http_session()
+
+# The connectivity probe only needs any answer at all: a 429/5xx still proves we are online,
+# so it must not be retried (or turned into a RetryError) like a page fetch
+PROBE_SESSION = build_http_session(pool_connections=1, pool_maxsize=1, retries=0)
+
+# Only the first few KB of article text are kept, so never download more than this
+MAX_PAGE_BYTES = 512_000
+
 # ============================================
 # TOOL DEFINITIONS
 # ============================================
@@ -53,12 +330,13 @@ class Tool:
 
 
 class InternetConnectivityTool(Tool):
-    def __init__(self):
+    def __init__(self, session: requests.Session = None):
         super().__init__("check_internet", "Check if internet connection is available")
+        self.session = session or PROBE_SESSION
 
     def execute(self) -> Dict[str, Any]:
         try:
-            response = requests.get("https://httpbin.org/get", timeout=5)
+            response = self.session.get("https://httpbin.org/get", timeout=5)
             return {
                 "success": True,
                 "status": "connected",
@@ -72,51 +350,117 @@ class InternetConnectivityTool(Tool):
             }
 
 
+# Message of the DDGSException raised when a search simply has no hits
+_DDGS_NO_RESULTS = "No results found."
+
+
 class NewsSearchTool(Tool):
     def __init__(self):
         super().__init__("search_news", "Search for current news articles on any topic")
-
-    def execute(self, query: str = "top news today", max_results: int = 20, **kwargs) -> Dict[str, Any]:
-        try:
-            print(f"🔍 Searching for: '{query}' (max: {max_results})")
-            with DDGS() as ddgs:
-                results = ddgs.text(
+        self._ddgs = None
+        self._ddgs_lock = threading.Lock()
+
+    def _client(self) -> DDGS:
+        """Lazily create one DDGS client so its HTTP session is reused across searches"""
+        with self._ddgs_lock:
+            if self._ddgs is None:
+                self._ddgs = DDGS()
+            return self._ddgs
+
+    def _text_with_backoff(self, query: str, max_results: int, retries: int = 3) -> List[Dict]:
+        """DDGS text search, retrying failed or timed-out searches with exponential backoff (0.5 s, 1 s, ...).
+
+        DDGS.text swallows per-engine errors (rate limits included) and raises a bare DDGSException
+        or TimeoutException once every engine failed; an empty result set is not retried.
+        """
+        for attempt in range(retries + 1):
+            try:
+                return self._client().text(
                     query,
                     region="us-en",
                     safesearch="moderate",
                     timelimit="d",
                     max_results=max_results
                 )
+            except DDGSException as e:
+                if attempt == retries or str(e) == _DDGS_NO_RESULTS:
+                    raise
+                delay = 0.5 * 2 ** attempt
+                print(f"   ⏳ Search failed ({e}), retrying in {delay:.1f}s...")
+                time.sleep(delay)
 
-                articles = []
-                for r in results:
-                    articles.append({
-                        "title": r.get('title', '[No Title]'),
-                        "summary": r.get('body', '[No Summary]'),
-                        "url": r.get('href', '[No Link]'),
-                        "timestamp": datetime.now().isoformat()
-                    })
-
-                return {
-                    "success": True,
-                    "articles": articles,
-                    "count": len(articles),
-                    "query": query
+    def execute(self, query: str = "top news today", max_results: int = 20, **kwargs) -> Dict[str, Any]:
+        try:
+            print(f"🔍 Searching for: '{query}' (max: {max_results})")
+            results = self._text_with_backoff(query, max_results)
+
+            ts = datetime.now().isoformat()
+            articles = [
+                {
+                    "title": r.get('title', '[No Title]'),
+                    "summary": r.get('body', '[No Summary]'),
+                    "url": r.get('href', '[No Link]'),
+                    "timestamp": ts
                 }
-        except Exception as e:
+                for r in results
+            ]
+
             return {
-                "success": False,
-                "error": str(e),
+                "success": True,
+                "articles": articles,
+                "count": len(articles),
+                "query": query
+            }
+        except DDGSException as e:
+            if str(e) != _DDGS_NO_RESULTS:
+                return self._failure(e)
+            # No hits is a valid answer, and one the agent caches to skip repeat searches
+            return {
+                "success": True,
                 "articles": [],
-                "count": 0
+                "count": 0,
+                "query": query
             }
+        except Exception as e:
+            return self._failure(e)
+
+    @staticmethod
+    def _failure(error: Exception) -> Dict[str, Any]:
+        return {
+            "success": False,
+            "error": str(error),
+            "articles": [],
+            "count": 0
+        }
 
 
 class WebScrapingTool(Tool):
-    def __init__(self):
+    def __init__(self, max_concurrency: int = 10, host_delay: float = 0.2, summary_concurrency: int = 6,
+                 per_host_concurrency: int = 4, session: requests.Session = None,
+                 parse_pool: Executor = None):
         super().__init__("scrape_articles", "Scrape full content from article URLs and generate summaries")
+        self.session = session or SESSION
+        # Optional (process) pool for HTML parsing; without it pages are parsed on the fetch threads
+        self.parse_pool = parse_pool
+        self.max_concurrency = max_concurrency
+        self.host_delay = host_delay
+        self.per_host_concurrency = per_host_concurrency
+        self.summary_concurrency = summary_concurrency
+        # Blocking fetch+parse work runs here; kept for the tool's lifetime so threads are reused across runs
+        self._pool = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="scrape")
 
     def execute(self, articles: List[Dict] = None, max_articles: int = 15, **kwargs) -> Dict[str, Any]:
+        return asyncio.run(self.execute_async(articles=articles, max_articles=max_articles, **kwargs))
+
+    async def execute_async(self, articles: List[Dict] = None, max_articles: int = 15,
+                            keep_content: bool = False, cache: Dict[str, tuple] = None,
+                            refresh: bool = False, **kwargs) -> Dict[str, Any]:
+        """Scrape articles concurrently; extracted text is only kept when keep_content is set.
+
+        cache, if given, maps normalized URLs to (scraped_at, result) of earlier articles whose
+        AI summary succeeded: hits younger than SCRAPE_TTL are reused without a request and
+        new successes are added to it. With refresh, existing entries are ignored and replaced.
+        """
         if not articles:
             return {
                 "success": False,
@@ -124,103 +468,206 @@ class WebScrapingTool(Tool):
                 "scraped_articles": []
             }
 
-        print(f"🌐 Scraping {min(len(articles), max_articles)} articles...")
-        scraped_articles = []
-
-        for i, article in enumerate(articles[:max_articles]):
+        # Drop duplicate links and unscrapable hosts before spending any requests on them
+        batch = []
+        seen = set()
+        skipped = 0
+        for article in articles:
+            if len(batch) >= max_articles:
+                break
             try:
-                print(f"   📄 Scraping article {i+1}: {article['title'][:50]}...")
-
-                # Get the full content
-                content = self.scrape_url(article['url'])
-
-                if content:
-                    # Generate summary using GPT-4
-                    if client:
-                        summary = self.generate_summary(article['title'], content)
-                    else:
-                        summary = f"AI summary unavailable (no API key). Content preview: {content[:200]}..."
-
-                    scraped_articles.append({
-                        "original_title": article['title'],
-                        "url": article['url'],
-                        "original_summary": article.get('summary', ''),
-                        "full_content": content[:2000],
-                        "ai_summary": summary,
-                        "scrape_timestamp": datetime.now().isoformat(),
-                        "word_count": len(content.split())
-                    })
-                    print(f"   ✅ Successfully scraped ({len(content.split())} words)")
-                else:
-                    print(f"   ⚠️ Could not scrape content")
-                    scraped_articles.append({
-                        "original_title": article['title'],
-                        "url": article['url'],
-                        "original_summary": article.get('summary', ''),
-                        "full_content": "",
-                        "ai_summary": "Could not scrape content from this URL",
-                        "scrape_timestamp": datetime.now().isoformat(),
-                        "word_count": 0
-                    })
-
-                time.sleep(0.5)
-
-            except Exception as e:
-                print(f"   ❌ Error scraping article {i+1}: {e}")
-                scraped_articles.append({
-                    "original_title": article['title'],
-                    "url": article['url'],
-                    "original_summary": article.get('summary', ''),
-                    "full_content": "",
-                    "ai_summary": f"Error scraping: {str(e)}",
-                    "scrape_timestamp": datetime.now().isoformat(),
-                    "word_count": 0
-                })
+                url = _normalize_url(article.get('url', ''))
+            except ValueError:  # malformed link, e.g. an unclosed IPv6 bracket
+                skipped += 1
+                continue
+            if url in seen or _is_skipped_host(url):
+                skipped += 1
+                continue
+            seen.add(url)
+            batch.append(article)
+            if refresh and cache is not None:
+                cache.pop(url, None)
+
+        if skipped:
+            print(f"   ⏭️ Skipped {skipped} duplicate or unscrapable links")
+        print(f"🌐 Scraping {len(batch)} articles (up to {self.max_concurrency} at a time)...")
+
+        ts = datetime.now().isoformat()
+        fetch_sem = asyncio.Semaphore(self.max_concurrency)
+        summary_sem = asyncio.Semaphore(self.summary_concurrency)
+        host_locks = defaultdict(asyncio.Lock)
+        host_slots = defaultdict(lambda: asyncio.Semaphore(self.per_host_concurrency))
+        last_hit = {}
+        # Created per run: the async client's connection pool is bound to this event loop
+        aclient = AsyncOpenAI(api_key=OPENAI_API_KEY) if OPENAI_API_KEY else None
+
+        async def fetch(url):
+            return await self._scrape_url_async(url, fetch_sem, host_locks, host_slots, last_hit)
+
+        async def summarize(title, content):
+            async with summary_sem:
+                return await self._generate_summary_async(aclient, title, content)
+
+        # Content hash -> article index, so wire copies under different URLs are summarized once
+        seen_content = {}
+        try:
+            scraped_articles = await asyncio.gather(*[
+                self._scrape_article(i, a, fetch, summarize, ts, keep_content, cache, seen_content)
+                for i, a in enumerate(batch)
+            ])
+        finally:
+            if aclient:
+                await aclient.close()
+
+        copies = scraped_articles.count(None)
+        if copies:
+            print(f"   ⏭️ Dropped {copies} copies of articles already scraped from another URL")
+            scraped_articles = [a for a in scraped_articles if a is not None]
+
+        # One pass for every aggregate the agent and the report need
+        successful = total_words = ai_summaries = 0
+        for a in scraped_articles:
+            if a['word_count'] > 0:
+                successful += 1
+                total_words += a['word_count']
+            if a['ai_summary']:
+                ai_summaries += 1
 
         return {
             "success": True,
             "scraped_articles": scraped_articles,
             "total_scraped": len(scraped_articles),
-            "successful_scrapes": len([a for a in scraped_articles if a['word_count'] > 0])
+            "successful_scrapes": successful,
+            "total_words": total_words,
+            "ai_summaries": ai_summaries
         }
 
-    def scrape_url(self, url: str) -> str:
-        """Scrape content from a URL"""
+    async def _scrape_article(self, i: int, article: Dict, fetch, summarize, ts: str,
+                              keep_content: bool, cache: Optional[Dict[str, tuple]],
+                              seen_content: Dict[str, int]) -> Optional[Dict[str, Any]]:
+        """Scrape and summarize a single article, never raising; None when its text
+        is an exact copy of another article in this run"""
+        key = _normalize_url(article['url'])
+        entry = cache.get(key) if cache is not None else None
+        if entry is not None:
+            scraped_at, scraped = entry
+            if time.time() - scraped_at <= SCRAPE_TTL:
+                print(f"   ♻️ Article {i+1} already scraped: {article['title'][:50]}...")
+                return scraped
+
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
+            print(f"   📄 Scraping article {i+1}: {article['title'][:50]}...")
+
+            # Get the full content
+            content, word_count = await fetch(article['url'])
+
+            if content:
+                # A trimmed page keeps at least ~2000 characters before its " ... ", so 1 KB is all article text
+                digest = hashlib.sha1(content[:1024].encode()).hexdigest()
+                if digest in seen_content:
+                    print(f"   ⏭️ Article {i+1} is a copy of article {seen_content[digest]+1}")
+                    return None
+                seen_content[digest] = i
+
+                # Generate AI summary; the fetch slot is already released. Only articles
+                # with a real summary are cached, so a failed call is retried next run
+                summarized = False
+                if client:
+                    try:
+                        summary = await summarize(article['title'], _truncate_tokens(content, SUMMARY_INPUT_TOKENS))
+                        summarized = True
+                    except Exception as e:
+                        summary = f"Summary generation failed: {str(e)}"
+                else:
+                    summary = f"AI summary unavailable (no API key). Content preview: {content[:200]}..."
 
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
+                print(f"   ✅ Article {i+1} scraped ({word_count} words)")
+                scraped = {
+                    "original_title": article['title'],
+                    "url": article['url'],
+                    "original_summary": article.get('summary', ''),
+                    "full_content": content[:2000] if keep_content else "",
+                    "ai_summary": summary,
+                    "scrape_timestamp": ts,
+                    "word_count": word_count
+                }
+                if cache is not None and summarized:
+                    cache[key] = (time.time(), scraped)
+                return scraped
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            print(f"   ⚠️ Could not scrape content for article {i+1}")
+            return {
+                "original_title": article['title'],
+                "url": article['url'],
+                "original_summary": article.get('summary', ''),
+                "full_content": "",
+                "ai_summary": "Could not scrape content from this URL",
+                "scrape_timestamp": ts,
+                "word_count": 0
+            }
 
-            for script in soup(["script", "style", "nav", "footer", "header", "aside"]):
-                script.decompose()
+        except Exception as e:
+            print(f"   ❌ Error scraping article {i+1}: {e}")
+            return {
+                "original_title": article['title'],
+                "url": article['url'],
+                "original_summary": article.get('summary', ''),
+                "full_content": "",
+                "ai_summary": f"Error scraping: {str(e)}",
+                "scrape_timestamp": ts,
+                "word_count": 0
+            }
 
-            content_selectors = [
-                'article', '[role="main"]', '.content', '.post-content',
-                '.entry-content', '.article-body', '.story-body', 'main'
-            ]
+    async def _scrape_url_async(self, url: str, fetch_sem, host_locks, host_slots,
+                                last_hit: Dict[str, float]) -> Tuple[str, int]:
+        """Fetch a URL off the event loop, spacing out request starts to the same host
+        and capping how many requests one host has in flight; ("", 0) on failure"""
+        host = urlsplit(url).netloc.lower()
+        loop = asyncio.get_running_loop()
+        async with host_slots[host]:
+            async with host_locks[host]:
+                if host in last_hit:
+                    wait = self.host_delay - (loop.time() - last_hit[host])
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+                last_hit[host] = loop.time()
+
+            async with fetch_sem:
+                if self.parse_pool is None:
+                    return await loop.run_in_executor(self._pool, self._scrape_page, url)
+                try:
+                    html, encoding = await loop.run_in_executor(self._pool, self.fetch_html, url)
+                except Exception as e:
+                    print(f"      Error fetching {url}: {e}")
+                    return "", 0
+
+        # Parsing is CPU-bound, so it runs outside the fetch and host slots
+        try:
+            return await loop.run_in_executor(self.parse_pool, _article_text, html, encoding)
+        except Exception as e:
+            print(f"      Error parsing {url}: {e}")
+            return "", 0
 
-            main_content = ""
-            for selector in content_selectors:
-                elements = soup.select(selector)
-                if elements:
-                    main_content = ' '.join([elem.get_text() for elem in elements])
-                    break
+    def fetch_html(self, url: str) -> Tuple[bytes, Optional[str]]:
+        """Download at most MAX_PAGE_BYTES of a page and its declared charset, raising on HTTP errors"""
+        with self.session.get(url, stream=True, timeout=10) as response:
+            response.raise_for_status()
+            # Only an explicit charset counts; requests would otherwise assume ISO-8859-1 for text/html
+            charset = _CHARSET_RE.search(response.headers.get("Content-Type", ""))
+            return response.raw.read(MAX_PAGE_BYTES, decode_content=True), charset and charset.group(1)
 
-            if not main_content:
-                paragraphs = soup.find_all('p')
-                main_content = ' '.join([p.get_text() for p in paragraphs])
+    def scrape_url(self, url: str) -> str:
+        """Scrape content from a URL"""
+        return self._scrape_page(url)[0]
 
-            main_content = re.sub(r'\s+', ' ', main_content).strip()
-            return main_content[:3000] if main_content else ""
+    def _scrape_page(self, url: str) -> Tuple[str, int]:
+        """Article text of a URL and its word count, ("", 0) on failure"""
+        try:
+            return _article_text(*self.fetch_html(url))
 
         except Exception as e:
             print(f"      Error fetching {url}: {e}")
-            return ""
+            return "", 0
 
     def generate_summary(self, title: str, content: str) -> str:
         """Generate AI summary of scraped content"""
@@ -231,38 +678,48 @@ class WebScrapingTool(Tool):
             return "Insufficient content to summarize"
 
         try:
-            prompt = f"""Summarize this news article concisely:
+            response = client.chat.completions.create(**self._summary_request(title, _truncate_tokens(content, SUMMARY_INPUT_TOKENS)))
+            return response.choices[0].message.content.strip()
 
-Title: {title}
+        except Exception as e:
+            return f"Summary generation failed: {str(e)}"
 
-Content: {content[:2000]}
+    async def _generate_summary_async(self, aclient: Optional[AsyncOpenAI], title: str, content: str) -> str:
+        """Async twin of generate_summary, so a batch of summaries can be requested concurrently.
 
-Provide a clear, factual summary in 3-4 sentences focusing on:
-1. Main news/event
-2. Key details and facts
-3. Any important implications or context"""
+        Unlike generate_summary, API errors are raised so the caller can tell a failed summary apart.
+        """
+        if not aclient:
+            return "AI summary unavailable (no API key configured)"
 
-            response = client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are an expert news summarizer. Provide concise, factual summaries."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=200,
-                temperature=0.2
-            )
+        if not content or len(content) < 100:
+            return "Insufficient content to summarize"
 
-            return response.choices[0].message.content.strip()
+        response = await aclient.chat.completions.create(**self._summary_request(title, content))
+        return response.choices[0].message.content.strip()
 
-        except Exception as e:
-            return f"Summary generation failed: {str(e)}"
+    def _summary_request(self, title: str, content: str) -> Dict[str, Any]:
+        """Build the chat completion arguments for a single article summary (content is pre-truncated)"""
+        prompt = _SUMMARY_TEMPLATE.format(title=title, content=content)
+
+        return {
+            "model": SUMMARY_MODEL,
+            "messages": [
+                {"role": "system", "content": "You are an expert news summarizer. Provide concise, factual summaries."},
+                {"role": "user", "content": prompt}
+            ],
+            "max_tokens": 200,
+            "temperature": 0.2
+        }
 
 
 class NewsAnalysisTool(Tool):
     def __init__(self):
         super().__init__("analyze_news", "Analyze news articles and answer questions about them")
 
-    def execute(self, articles: List[Dict] = None, question: str = "Analyze these articles", **kwargs) -> Dict[str, Any]:
+    def execute(self, articles: List[Dict] = None, question: str = "Analyze these articles",
+                max_articles: int = 5, **kwargs) -> Dict[str, Any]:
+        """Answer question from up to max_articles search results in a single completion"""
         if not articles:
             return {
                 "success": False,
@@ -277,17 +734,13 @@ class NewsAnalysisTool(Tool):
                 "error": "No OpenAI API key"
             }
 
+        articles = articles[:max_articles]
         print(f"🧠 Analyzing {len(articles)} articles with question: '{question}'")
 
-        context_parts = []
-        for i, article in enumerate(articles[:5]):
-            context_parts.append(
-                f"{i+1}. Title: {article['title']}\n"
-                f"   Summary: {article['summary'][:200]}...\n"
-                f"   URL: {article['url']}"
-            )
-
-        context = "\n\n".join(context_parts)
+        context = "\n\n".join(
+            "%d. Title: %s\n   Summary: %s...\n   URL: %s" % (i, a['title'], a['summary'][:200], a['url'])
+            for i, a in enumerate(articles, 1)
+        )
         prompt = f"""Based on these current news articles:
 
 {context}
@@ -302,7 +755,7 @@ Please provide a comprehensive analysis based on the news provided. Include:
 
         try:
             response = client.chat.completions.create(
-                model="gpt-4",
+                model=REPORT_MODEL,
                 messages=[
                     {"role": "system", "content": "You are an expert news analyst. Provide thorough, factual analysis based on the provided articles."},
                     {"role": "user", "content": prompt}
@@ -314,7 +767,7 @@ Please provide a comprehensive analysis based on the news provided. Include:
             return {
                 "success": True,
                 "analysis": response.choices[0].message.content.strip(),
-                "articles_analyzed": len(articles[:5]),
+                "articles_analyzed": len(articles),
                 "question": question
             }
         except Exception as e:
@@ -339,14 +792,21 @@ class ReportGenerationTool(Tool):
 
         print(f"📊 Generating comprehensive report from {len(scraped_articles)} articles...")
 
+        # One pass: filter successful articles, total their words and format their summaries
         article_summaries = []
-        successful_articles = [a for a in scraped_articles if a['word_count'] > 0]
+        successful_articles = []
+        total_words = 0
 
-        for i, article in enumerate(successful_articles, 1):
+        for article in scraped_articles:
+            word_count = article['word_count']
+            if word_count <= 0:
+                continue
+            total_words += word_count
+            successful_articles.append(article)
             article_summaries.append(f"""
-Article {i}: {article['original_title']}
+Article {len(successful_articles)}: {article['original_title']}
 Source: {article['url']}
-Word Count: {article['word_count']}
+Word Count: {word_count}
 Summary: {article['ai_summary']}
 """)
 
@@ -366,7 +826,7 @@ Summary: {article['ai_summary']}
 Analysis of {len(successful_articles)} articles about {topic}.
 
 **Major Themes**
-Based on {len(successful_articles)} scraped articles with a total of {sum(a['word_count'] for a in successful_articles):,} words analyzed.
+Based on {len(successful_articles)} scraped articles with a total of {total_words:,} words analyzed.
 
 **Key Developments**
 {combined_content[:1000]}
@@ -383,24 +843,14 @@ Based on {len(successful_articles)} scraped articles with a total of {sum(a['wor
             }
 
         try:
-            report_prompt = f"""Create a comprehensive news analysis report based on these article summaries:
-
-Topic: {topic}
-Number of articles analyzed: {len(successful_articles)}
-
-{combined_content}
-
-Generate a professional report with:
-1. **Executive Summary** - Key findings and trends
-2. **Major Themes** - Common topics and patterns
-3. **Key Developments** - Most important news items
-4. **Analysis & Insights** - What these developments mean
-5. **Sources Summary** - Brief overview of sources used
-
-Format as a clear, well-structured report suitable for executive briefing."""
+            report_prompt = _REPORT_TEMPLATE.format(
+                topic=topic,
+                article_count=len(successful_articles),
+                combined_content=_truncate_tokens(combined_content, REPORT_INPUT_TOKENS, REPORT_MODEL)
+            )
 
             response = client.chat.completions.create(
-                model="gpt-4",
+                model=REPORT_MODEL,
                 messages=[
                     {"role": "system", "content": "You are an expert news analyst creating executive-level reports. Be comprehensive, insightful, and professional."},
                     {"role": "user", "content": report_prompt}
@@ -432,15 +882,242 @@ Format as a clear, well-structured report suitable for executive briefing."""
 # ENHANCED DOCUMENT GENERATOR
 # ============================================
 
+_W_NS = nsdecls('w')
+
+# Report timestamp formats
+_COVER_FMT = '%B %d, %Y at %I:%M %p'
+_APPENDIX_FMT = '%Y-%m-%d %H:%M:%S'
+_FOOTER_FMT = '%B %d, %Y'
+_FILENAME_TS_FMT = '%Y%m%d_%H%M%S'
+
+
+class _FilenameChars(dict):
+    """str.translate table keeping alphanumerics, spaces, '-' and '_'; filled in per code point on first sight"""
+
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        self[codepoint] = codepoint if char.isalnum() or char in ' -_' else None
+        return self[codepoint]
+
+
+_FILENAME_CHARS = _FilenameChars()
+
+
+def _run_xml(text: str, *, bold: bool = False, italic: bool = False, size=None, color=None) -> str:
+    """WordprocessingML for one formatted run; size is a docx Length, color an RGBColor"""
+    rpr = []
+    if bold:
+        rpr.append('<w:b/>')
+    if italic:
+        rpr.append('<w:i/>')
+    if color is not None:
+        rpr.append(f'<w:color w:val="{color}"/>')
+    if size is not None:
+        rpr.append(f'<w:sz w:val="{round(size.pt * 2)}"/>')
+    rpr_xml = f'<w:rPr>{"".join(rpr)}</w:rPr>' if rpr else ''
+    # Line breaks and tabs become <w:br/> and <w:tab/>, the same as python-docx's run.text setter
+    body = (escape(text)
+            .replace('\n', '</w:t><w:br/><w:t xml:space="preserve">')
+            .replace('\t', '</w:t><w:tab/><w:t xml:space="preserve">'))
+    return f'<w:r>{rpr_xml}<w:t xml:space="preserve">{body}</w:t></w:r>'
+
+
+def _paragraph_xml(runs_xml: str, *, align: str = None, ppr: str = '') -> str:
+    """WordprocessingML for a paragraph holding the given runs; align is a w:jc value,
+    ppr any pPr children that precede it (spacing, ind)"""
+    if align:
+        ppr += f'<w:jc w:val="{align}"/>'
+    ppr_xml = f'<w:pPr>{ppr}</w:pPr>' if ppr else ''
+    return f'<w:p>{ppr_xml}{runs_xml}</w:p>'
+
+
+def _lines_xml(lines) -> str:
+    """One paragraph with each line as its own run, followed by a line break"""
+    return _paragraph_xml("".join(_run_xml(line + "\n") for line in lines))
+
+
+def _rule_xml(color) -> str:
+    """An empty paragraph drawn as a horizontal rule by its bottom border"""
+    return _paragraph_xml('', ppr=f'<w:pBdr><w:bottom w:val="single" w:sz="6" w:space="1" w:color="{color}"/></w:pBdr>')
+
+
+def _w_elements(xml: str) -> list:
+    """Parse a WordprocessingML fragment (one or more sibling elements) into oxml elements"""
+    return list(parse_xml(f'<w:body {_W_NS}>{xml}</w:body>'))
+
+
+def _insert_body_xml(doc, xml: str):
+    """Parse a fragment once and add its elements at the end of the body, ahead of sectPr"""
+    body = doc.element.body
+    sect_pr = body.sectPr
+    for element in _w_elements(xml):
+        if sect_pr is not None:
+            sect_pr.addprevious(element)
+        else:
+            body.append(element)
+
+
+# Markdown headers in generated reports: a '#' line, or a line that starts and ends with '**'
+_REPORT_HEADER_RE = re.compile(r'^(?:#.*|\*\*(?:.*\*\*|\*?))$', re.M)
+
+# Article deep-dive details table: 1.5" label column, 5" value column (twips)
+_DETAILS_TABLE_XML = (
+    '<w:tbl><w:tblPr><w:tblStyle w:val="TableGrid"/><w:tblW w:type="auto" w:w="0"/>'
+    '<w:tblLook w:val="04A0" w:firstRow="1" w:lastRow="0" w:firstColumn="1" w:lastColumn="0"'
+    ' w:noHBand="0" w:noVBand="1"/></w:tblPr>'
+    '<w:tblGrid><w:gridCol w:w="2160"/><w:gridCol w:w="7200"/></w:tblGrid>{rows}</w:tbl>'
+)
+_DETAILS_ROW_XML = (
+    '<w:tr><w:tc><w:tcPr><w:tcW w:w="2160" w:type="dxa"/></w:tcPr>{label}</w:tc>'
+    '<w:tc><w:tcPr><w:tcW w:w="7200" w:type="dxa"/></w:tcPr>{value}</w:tc></w:tr>'
+)
+_INDENT_PPR = '<w:ind w:left="360"/>'
+_PREVIEW_COLOR = RGBColor(64, 64, 64)
+_SEPARATOR_COLOR = RGBColor(200, 200, 200)
+# Dot leader running out to the right margin (6.5" of text width)
+_TOC_TABS_PPR = '<w:tabs><w:tab w:val="right" w:leader="dot" w:pos="9360"/></w:tabs>'
+_SUMMARY_PPR = '<w:spacing w:before="120" w:after="120"/><w:ind w:left="360" w:right="360"/>'
+
+
+# Fixed report sections, rendered once; the braces are filled per document with escaped values
+_TOC_ITEMS = [
+    ("Executive Dashboard", "Key metrics and performance indicators"),
+    ("Key Findings", "Principal discoveries and insights"),
+    ("Detailed Analysis", "Comprehensive analytical breakdown"),
+    ("Article Deep Dive", "Individual article examination"),
+    ("Statistical Analysis", "Quantitative data assessment"),
+    ("Source Credibility", "Source reliability evaluation"),
+    ("Technical Appendix", "Implementation details"),
+]
+
+_SYSTEM_INFO_XML = _lines_xml([
+    "• Report Generated: {generated}",
+    "• Analysis Engine: {engine}",
+    "• Scraping Engine: BeautifulSoup 4",
+    "• Search Provider: DuckDuckGo",
+    "• Document Format: Microsoft Word (.docx)",
+    "• Processing Pipeline: Automated Multi-Stage",
+    "• Quality Assurance: Multi-Point Verification",
+])
+
+
+@lru_cache(maxsize=None)
+def _toc_xml(title_color, leader_color, desc_color) -> str:
+    """Table of contents entries: numbered title with a dotted tab leader, then an indented description"""
+    parts = []
+    for i, (title, description) in enumerate(_TOC_ITEMS, 1):
+        parts.append(_paragraph_xml(
+            _run_xml(f"{i}. ", bold=True, size=Pt(12))
+            + _run_xml(title, bold=True, size=Pt(12), color=title_color)
+            + _run_xml("\t", size=Pt(12), color=leader_color),
+            ppr=_TOC_TABS_PPR + _INDENT_PPR))
+        parts.append(_paragraph_xml(
+            _run_xml(description, italic=True, size=Pt(10), color=desc_color),
+            ppr='<w:ind w:left="720"/>'))
+    return "".join(parts)
+
+
+@lru_cache(maxsize=None)
+def _cover_xml(accent_color) -> tuple:
+    """Cover page paragraphs above ({topic}) and below ({generated}, {engine}) the metrics table"""
+    head = "".join([
+        _paragraph_xml(_run_xml("\n\n")),
+        _paragraph_xml(_run_xml("COMPREHENSIVE NEWS ANALYSIS"), ppr='<w:pStyle w:val="CoverTitle"/>'),
+        _paragraph_xml(_run_xml("Topic: {topic}", italic=True, size=Pt(20), color=accent_color), align='center'),
+        _paragraph_xml(_run_xml("\n")),
+        _rule_xml(accent_color),
+        _paragraph_xml(_run_xml("\n")),
+    ])
+    tail = "".join([
+        _paragraph_xml(_run_xml("\n\n")),
+        _paragraph_xml(_run_xml("Generated: ", size=Pt(10))
+                       + _run_xml("{generated}", bold=True, size=Pt(10)), align='center'),
+        _paragraph_xml(_run_xml("Powered by: ", size=Pt(10))
+                       + _run_xml("{engine} Analysis Engine", bold=True, size=Pt(10), color=accent_color),
+                       align='center'),
+    ])
+    return head, tail
+
+
+def _word_count_stats(word_counts: List[int]) -> tuple:
+    """Shortest, longest, median (upper middle) and population std dev of a non-empty list"""
+    ordered = sorted(word_counts)
+    return ordered[0], ordered[-1], ordered[len(ordered) // 2], statistics.pstdev(ordered)
+
+
+def _render_article_xml(article: Dict, i: int, *, last: bool, title_color) -> str:
+    """WordprocessingML for one deep-dive article: header, details table, summaries and separator"""
+    # Article header with formatting
+    parts = [_paragraph_xml(
+        _run_xml(f"Article {i}: ", bold=True, size=Pt(12), color=title_color)
+        + _run_xml(article['original_title'], italic=True, size=Pt(12)))]
+
+    # Article details table, column widths fixed in the grid
+    details = [
+        ["Source URL", article['url']],
+        ["Word Count", f"{article['word_count']:,} words"],
+        ["Extraction Time", article['scrape_timestamp'][:19].replace('T', ' at ')],
+        ["Extraction Status", "✓ Successful" if article['word_count'] > 0 else "✗ Failed"]
+    ]
+    parts.append(_DETAILS_TABLE_XML.format(rows="".join(
+        _DETAILS_ROW_XML.format(
+            label=_paragraph_xml(_run_xml(label, bold=True, size=Pt(10))),
+            value=_paragraph_xml(_run_xml(value, size=Pt(10))))
+        for label, value in details)))
+
+    parts.append('<w:p/>')
+
+    # AI Summary with special formatting
+    parts.append(_paragraph_xml(_run_xml("AI-Generated Summary:", bold=True)))
+    parts.append(_paragraph_xml(
+        _run_xml(article.get('ai_summary', 'No summary available'), size=Pt(11)),
+        ppr=_SUMMARY_PPR))
+
+    # Add original summary if available
+    if article.get('original_summary'):
+        parts.append(_paragraph_xml(_run_xml("Original Summary:", bold=True)))
+        parts.append(_paragraph_xml(
+            _run_xml(article['original_summary'], size=Pt(10)), ppr=_INDENT_PPR))
+
+    # Add content preview if available
+    content = article.get('full_content')
+    if content:
+        parts.append(_paragraph_xml(_run_xml("Content Preview (First 300 characters):", bold=True)))
+        preview_text = content[:300] + "..." if len(content) > 300 else content
+        parts.append(_paragraph_xml(
+            _run_xml(preview_text, size=Pt(9), color=_PREVIEW_COLOR), ppr=_INDENT_PPR))
+
+    # Add separator
+    if not last:
+        parts.append(_rule_xml(_SEPARATOR_COLOR))
+
+    return "".join(parts)
+
+
 class EnhancedDocumentGenerator:
     """Enhanced professional Word document generator with advanced formatting"""
 
-    def __init__(self):
-        self.primary_color = RGBColor(0, 32, 96)  # Dark blue
-        self.accent_color = RGBColor(0, 120, 215)  # Lighter blue
-        self.success_color = RGBColor(0, 176, 80)  # Green
-        self.warning_color = RGBColor(255, 192, 0)  # Amber
-        self.error_color = RGBColor(237, 28, 36)  # Red
+    PRIMARY_COLOR = RGBColor(0, 32, 96)  # Dark blue
+    ACCENT_COLOR = RGBColor(0, 120, 215)  # Lighter blue
+    SUCCESS_COLOR = RGBColor(0, 176, 80)  # Green
+    WARNING_COLOR = RGBColor(255, 192, 0)  # Amber
+    ERROR_COLOR = RGBColor(237, 28, 36)  # Red
+    MUTED_COLOR = RGBColor(128, 128, 128)  # Grey
+    DARK_GREY_COLOR = RGBColor(64, 64, 64)  # Dark grey
+
+    # Execution-log details per tool; other tools fall back to their status or error
+    _TOOL_DETAILS = {
+        "search_news": lambda r: f"Found {r.get('count', 0)} articles",
+        "scrape_articles": lambda r: f"Scraped {r.get('successful_scrapes', 0)}/{r.get('total_scraped', 0)} articles",
+        "analyze_news": lambda r: f"Analyzed {r.get('articles_analyzed', 0)} articles",
+        "generate_report": lambda r: f"Report with {r.get('articles_analyzed', 0)} sources",
+        "generate_document": lambda r: f"Document: {r.get('document_path', 'N/A')}",
+        "check_internet": lambda r: f"Status: {r.get('status', 'Unknown')}",
+    }
+
+    # Saved blank document with the report styles and margins, built on first use
+    _template = None
+    _template_lock = threading.Lock()
 
     def create_professional_document(self,
                                      results: Dict,
@@ -452,12 +1129,12 @@ class EnhancedDocumentGenerator:
         print(f"📄 Generating enhanced professional Word document...")
 
         try:
-            doc = Document()
-            self._setup_advanced_styles(doc)
-            self._configure_document_settings(doc)
+            doc = self._new_document()
+            # One timestamp for the cover, appendix, footer and filename
+            now = datetime.now()
 
             # Add all sections with enhanced formatting
-            self._add_cover_page(doc, original_request, results)
+            self._add_cover_page(doc, original_request, results, now)
             self._add_table_of_contents(doc, results)
             self._add_executive_dashboard(doc, results, config)
             self._add_key_findings(doc, results)
@@ -465,12 +1142,12 @@ class EnhancedDocumentGenerator:
             self._add_article_deep_dive(doc, results, config)
             self._add_statistical_analysis(doc, results)
             self._add_source_credibility(doc, results)
-            self._add_appendices(doc, results)
-            self._add_footer_headers(doc, original_request)
+            self._add_appendices(doc, results, now)
+            self._add_footer_headers(doc, original_request, now)
 
             # Generate filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            safe_request = "".join(c for c in original_request if c.isalnum() or c in (' ', '-', '_')).rstrip()[:30]
+            timestamp = now.strftime(_FILENAME_TS_FMT)
+            safe_request = original_request.translate(_FILENAME_CHARS).rstrip()[:30]
             filename = f"Professional_News_Analysis_{safe_request}_{timestamp}.docx"
 
             doc.save(filename)
@@ -483,43 +1160,60 @@ class EnhancedDocumentGenerator:
             print(f"❌ Document generation failed: {str(e)}")
             raise
 
+    def _new_document(self):
+        """Open a fresh document from the cached styled template"""
+        cls = type(self)
+        with cls._template_lock:
+            if cls._template is None:
+                doc = Document()
+                self._setup_advanced_styles(doc)
+                self._configure_document_settings(doc)
+                buffer = io.BytesIO()
+                doc.save(buffer)
+                cls._template = buffer.getvalue()
+        return Document(io.BytesIO(cls._template))
+
     def _setup_advanced_styles(self, doc):
         """Set up professional document styles with corporate formatting"""
         styles = doc.styles
+        existing_names = {s.name for s in styles}
 
         # Cover Title Style
-        if 'Cover Title' not in [s.name for s in styles]:
+        if 'Cover Title' not in existing_names:
             cover_style = styles.add_style('Cover Title', WD_STYLE_TYPE.PARAGRAPH)
             cover_font = cover_style.font
             cover_font.name = 'Calibri Light'
             cover_font.size = Pt(36)
             cover_font.bold = True
-            cover_font.color.rgb = self.primary_color
+            cover_font.color.rgb = self.PRIMARY_COLOR
             cover_style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
             cover_style.paragraph_format.space_after = Pt(24)
+            existing_names.add('Cover Title')
 
         # Section Header Style
-        if 'Section Header' not in [s.name for s in styles]:
+        if 'Section Header' not in existing_names:
             section_style = styles.add_style('Section Header', WD_STYLE_TYPE.PARAGRAPH)
             section_font = section_style.font
             section_font.name = 'Calibri'
             section_font.size = Pt(18)
             section_font.bold = True
-            section_font.color.rgb = self.primary_color
+            section_font.color.rgb = self.PRIMARY_COLOR
             section_style.paragraph_format.space_before = Pt(18)
             section_style.paragraph_format.space_after = Pt(12)
             section_style.paragraph_format.keep_with_next = True
+            existing_names.add('Section Header')
 
         # Subsection Style
-        if 'Subsection' not in [s.name for s in styles]:
+        if 'Subsection' not in existing_names:
             subsection_style = styles.add_style('Subsection', WD_STYLE_TYPE.PARAGRAPH)
             subsection_font = subsection_style.font
             subsection_font.name = 'Calibri'
             subsection_font.size = Pt(14)
             subsection_font.bold = True
-            subsection_font.color.rgb = self.accent_color
+            subsection_font.color.rgb = self.ACCENT_COLOR
             subsection_style.paragraph_format.space_before = Pt(12)
             subsection_style.paragraph_format.space_after = Pt(6)
+            existing_names.add('Subsection')
 
     def _configure_document_settings(self, doc):
         """Configure document-wide settings"""
@@ -530,29 +1224,10 @@ class EnhancedDocumentGenerator:
             section.left_margin = Inches(1)
             section.right_margin = Inches(1)
 
-    def _add_cover_page(self, doc, original_request, results):
+    def _add_cover_page(self, doc, original_request, results, now):
         """Create an impressive cover page"""
-        doc.add_paragraph("\n\n")
-
-        # Main title
-        title = doc.add_paragraph("COMPREHENSIVE NEWS ANALYSIS", style='Cover Title')
-
-        # Subtitle with request
-        subtitle = doc.add_paragraph()
-        subtitle_run = subtitle.add_run(f"Topic: {original_request}")
-        subtitle_run.font.size = Pt(20)
-        subtitle_run.font.color.rgb = self.accent_color
-        subtitle_run.font.italic = True
-        subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-        doc.add_paragraph("\n")
-
-        # Add visual separator
-        separator = doc.add_paragraph("─" * 60)
-        separator.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        separator.runs[0].font.color.rgb = self.accent_color
-
-        doc.add_paragraph("\n")
+        head_xml, tail_xml = _cover_xml(self.ACCENT_COLOR)
+        _insert_body_xml(doc, head_xml.format(topic=escape(original_request)))
 
         # Key metrics box
         metrics_table = doc.add_table(rows=2, cols=4)
@@ -563,12 +1238,8 @@ class EnhancedDocumentGenerator:
 
         # Add metrics headers
         headers = ['Articles Found', 'Articles Scraped', 'Success Rate', 'Analysis Depth']
-        for i, header in enumerate(headers):
-            cell = metrics_table.rows[0].cells[i]
-            cell.text = header
-            cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
-            cell.paragraphs[0].runs[0].font.bold = True
-            cell.paragraphs[0].runs[0].font.size = Pt(10)
+        for cell, header in zip(metrics_table.rows[0].cells, headers):
+            self._fast_cell(cell, header, bold=True, size=Pt(10), align='center')
 
         # Add metrics values
         search_count = results.get('search_news', {}).get('count', 0)
@@ -583,32 +1254,13 @@ class EnhancedDocumentGenerator:
             "COMPREHENSIVE"
         ]
 
-        for i, value in enumerate(values):
-            cell = metrics_table.rows[1].cells[i]
-            cell.text = value
-            cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
-            cell.paragraphs[0].runs[0].font.size = Pt(14)
-            cell.paragraphs[0].runs[0].font.bold = True
-            cell.paragraphs[0].runs[0].font.color.rgb = self.accent_color
-
-        doc.add_paragraph("\n\n")
-
-        # Generation details
-        gen_details = doc.add_paragraph()
-        gen_details.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        gen_details.add_run("Generated: ").font.size = Pt(10)
-        gen_run = gen_details.add_run(datetime.now().strftime('%B %d, %Y at %I:%M %p'))
-        gen_run.font.size = Pt(10)
-        gen_run.font.bold = True
-
-        # Analysis engine
-        engine_para = doc.add_paragraph()
-        engine_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        engine_para.add_run("Powered by: ").font.size = Pt(10)
-        engine_run = engine_para.add_run("GPT-4 Advanced Analysis Engine")
-        engine_run.font.size = Pt(10)
-        engine_run.font.bold = True
-        engine_run.font.color.rgb = self.accent_color
+        for cell, value in zip(metrics_table.rows[1].cells, values):
+            self._fast_cell(cell, value, bold=True, size=Pt(14), color=self.ACCENT_COLOR, align='center')
+
+        # Generation details and analysis engine
+        _insert_body_xml(doc, tail_xml.format(
+            generated=escape(now.strftime(_COVER_FMT)),
+            engine=escape(REPORT_MODEL)))
 
         doc.add_page_break()
 
@@ -616,42 +1268,7 @@ class EnhancedDocumentGenerator:
         """Add a table of contents with page references"""
         doc.add_paragraph("TABLE OF CONTENTS", style='Section Header')
 
-        toc_items = [
-            ("Executive Dashboard", "Key metrics and performance indicators"),
-            ("Key Findings", "Principal discoveries and insights"),
-            ("Detailed Analysis", "Comprehensive analytical breakdown"),
-            ("Article Deep Dive", "Individual article examination"),
-            ("Statistical Analysis", "Quantitative data assessment"),
-            ("Source Credibility", "Source reliability evaluation"),
-            ("Technical Appendix", "Implementation details"),
-        ]
-
-        for i, (title, description) in enumerate(toc_items, 1):
-            toc_para = doc.add_paragraph()
-            toc_para.paragraph_format.left_indent = Inches(0.25)
-
-            # Add number and title
-            num_run = toc_para.add_run(f"{i}. ")
-            num_run.font.size = Pt(12)
-            num_run.font.bold = True
-
-            title_run = toc_para.add_run(title)
-            title_run.font.size = Pt(12)
-            title_run.font.bold = True
-            title_run.font.color.rgb = self.primary_color
-
-            # Add dots
-            dots_run = toc_para.add_run(" " + "." * 50)
-            dots_run.font.size = Pt(12)
-            dots_run.font.color.rgb = RGBColor(128, 128, 128)
-
-            # Add description
-            desc_para = doc.add_paragraph()
-            desc_para.paragraph_format.left_indent = Inches(0.5)
-            desc_run = desc_para.add_run(description)
-            desc_run.font.size = Pt(10)
-            desc_run.font.italic = True
-            desc_run.font.color.rgb = RGBColor(64, 64, 64)
+        _insert_body_xml(doc, _toc_xml(self.PRIMARY_COLOR, self.MUTED_COLOR, self.DARK_GREY_COLOR))
 
         doc.add_page_break()
 
@@ -662,6 +1279,11 @@ class EnhancedDocumentGenerator:
         # Performance Overview
         doc.add_paragraph("Performance Overview", style='Subsection')
 
+        articles_list = results.get('scrape_articles', {}).get('scraped_articles', [])
+        ai_ok = sum(1 for a in articles_list
+                    if a.get('ai_summary') and a['ai_summary'] != "Could not scrape content from this URL")
+        report_ok = results.get('generate_report', {}).get('success')
+
         # Create performance table
         perf_table = doc.add_table(rows=5, cols=3)
         perf_table.style = 'Medium Shading 1'
@@ -675,39 +1297,35 @@ class EnhancedDocumentGenerator:
              str(results.get('scrape_articles', {}).get('successful_scrapes', 0)),
              "✓ Complete"],
             ["AI Summaries Generated",
-             str(len([a for a in results.get('scrape_articles', {}).get('scraped_articles', [])
-                      if a.get('ai_summary') and a['ai_summary'] != "Could not scrape content from this URL"])),
+             str(ai_ok),
              "✓ Complete"],
             ["Comprehensive Report",
-             "Generated" if results.get('generate_report', {}).get('success') else "Not Generated",
-             "✓ Complete" if results.get('generate_report', {}).get('success') else "✗ Failed"]
+             "Generated" if report_ok else "Not Generated",
+             "✓ Complete" if report_ok else "✗ Failed"]
         ]
 
-        for row_idx, row_data in enumerate(performance_data):
-            for col_idx, cell_data in enumerate(row_data):
-                cell = perf_table.rows[row_idx].cells[col_idx]
-                cell.text = cell_data
+        for row_idx, (row, row_data) in enumerate(zip(perf_table.rows, performance_data)):
+            for cell, cell_data in zip(row.cells, row_data):
                 if row_idx == 0:
-                    cell.paragraphs[0].runs[0].font.bold = True
-                    cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
+                    self._fast_cell(cell, cell_data, bold=True, align='center')
+                else:
+                    self._fast_cell(cell, cell_data)
 
         doc.add_paragraph("")
 
         # Analysis Configuration
         doc.add_paragraph("Analysis Configuration", style='Subsection')
 
-        config_para = doc.add_paragraph()
         config_items = [
             f"• Search Query: {results.get('search_news', {}).get('query', 'N/A')}",
             f"• Maximum Articles Requested: {config.get('max_articles', 15)}",
             f"• Scraping Depth: Full Content Extraction",
-            f"• AI Model: GPT-4 (Advanced)" if client else "• AI Model: Not configured",
+            f"• AI Models: {SUMMARY_MODEL} (summaries), {REPORT_MODEL} (analysis)" if client else "• AI Model: Not configured",
             f"• Analysis Type: Comprehensive Multi-Source",
             f"• Report Format: Professional Executive Brief"
         ]
 
-        for item in config_items:
-            config_para.add_run(item + "\n")
+        _insert_body_xml(doc, _lines_xml(config_items))
 
         doc.add_paragraph("")
 
@@ -749,6 +1367,7 @@ class EnhancedDocumentGenerator:
 
         scraped_articles = results['scrape_articles'].get('scraped_articles', [])
         successful_articles = [a for a in scraped_articles if a.get('word_count', 0) > 0]
+        total_words = sum(a['word_count'] for a in successful_articles)
 
         # Summary statistics
         doc.add_paragraph("Coverage Statistics", style='Subsection')
@@ -759,8 +1378,8 @@ class EnhancedDocumentGenerator:
         stats_data = [
             ["Total Articles Processed", str(len(scraped_articles))],
             ["Successfully Analyzed", str(len(successful_articles))],
-            ["Total Words Processed", str(sum(a.get('word_count', 0) for a in successful_articles))],
-            ["Average Article Length", f"{sum(a.get('word_count', 0) for a in successful_articles) // max(len(successful_articles), 1)} words"]
+            ["Total Words Processed", str(total_words)],
+            ["Average Article Length", f"{total_words // max(len(successful_articles), 1)} words"]
         ]
 
         for row_idx, (label, value) in enumerate(stats_data):
@@ -775,87 +1394,10 @@ class EnhancedDocumentGenerator:
 
         max_articles_to_show = config.get('max_articles_in_report', len(successful_articles))
 
-        for i, article in enumerate(successful_articles[:max_articles_to_show], 1):
-            # Article header with formatting
-            article_header = doc.add_paragraph()
-            article_num = article_header.add_run(f"Article {i}: ")
-            article_num.font.bold = True
-            article_num.font.size = Pt(12)
-            article_num.font.color.rgb = self.primary_color
-
-            article_title = article_header.add_run(article['original_title'])
-            article_title.font.size = Pt(12)
-            article_title.font.italic = True
-
-            # Create article details table
-            details_table = doc.add_table(rows=4, cols=2)
-            details_table.style = 'Table Grid'
-
-            # Set column widths
-            for cell in details_table.columns[0].cells:
-                cell.width = Inches(1.5)
-            for cell in details_table.columns[1].cells:
-                cell.width = Inches(5)
-
-            details = [
-                ["Source URL", article['url']],
-                ["Word Count", f"{article['word_count']:,} words"],
-                ["Extraction Time", article['scrape_timestamp'][:19].replace('T', ' at ')],
-                ["Extraction Status", "✓ Successful" if article['word_count'] > 0 else "✗ Failed"]
-            ]
-
-            for row_idx, (label, value) in enumerate(details):
-                label_cell = details_table.rows[row_idx].cells[0]
-                label_cell.text = label
-                label_cell.paragraphs[0].runs[0].font.bold = True
-                label_cell.paragraphs[0].runs[0].font.size = Pt(10)
-
-                value_cell = details_table.rows[row_idx].cells[1]
-                value_cell.text = value
-                value_cell.paragraphs[0].runs[0].font.size = Pt(10)
-
-            doc.add_paragraph("")
-
-            # AI Summary with special formatting
-            summary_header = doc.add_paragraph()
-            summary_header.add_run("AI-Generated Summary:").font.bold = True
-
-            summary_para = doc.add_paragraph()
-            summary_para.paragraph_format.left_indent = Inches(0.25)
-            summary_para.paragraph_format.right_indent = Inches(0.25)
-            summary_para.paragraph_format.space_before = Pt(6)
-            summary_para.paragraph_format.space_after = Pt(6)
-
-            summary_run = summary_para.add_run(article.get('ai_summary', 'No summary available'))
-            summary_run.font.size = Pt(11)
-
-            # Add original summary if available
-            if article.get('original_summary'):
-                orig_header = doc.add_paragraph()
-                orig_header.add_run("Original Summary:").font.bold = True
-
-                orig_para = doc.add_paragraph()
-                orig_para.paragraph_format.left_indent = Inches(0.25)
-                orig_para.add_run(article['original_summary']).font.size = Pt(10)
-
-            # Add content preview if available
-            if article.get('full_content'):
-                preview_header = doc.add_paragraph()
-                preview_header.add_run("Content Preview (First 300 characters):").font.bold = True
-
-                preview_para = doc.add_paragraph()
-                preview_para.paragraph_format.left_indent = Inches(0.25)
-                preview_text = article['full_content'][:300] + "..." if len(article['full_content']) > 300 else article['full_content']
-                preview_run = preview_para.add_run(preview_text)
-                preview_run.font.size = Pt(9)
-                preview_run.font.color.rgb = RGBColor(64, 64, 64)
-
-            # Add separator
-            if i < len(successful_articles[:max_articles_to_show]):
-                separator = doc.add_paragraph("─" * 80)
-                separator.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                separator.runs[0].font.color.rgb = RGBColor(200, 200, 200)
-                separator.runs[0].font.size = Pt(8)
+        shown_articles = successful_articles[:max_articles_to_show]
+        _insert_body_xml(doc, "".join(
+            _render_article_xml(article, i, last=i == len(shown_articles), title_color=self.PRIMARY_COLOR)
+            for i, article in enumerate(shown_articles, 1)))
 
         doc.add_page_break()
 
@@ -868,7 +1410,9 @@ class EnhancedDocumentGenerator:
 
         scraped_articles = results.get('scrape_articles', {}).get('scraped_articles', [])
         successful = [a for a in scraped_articles if a.get('word_count', 0) > 0]
-        failed = [a for a in scraped_articles if a.get('word_count', 0) == 0]
+        failed_count = sum(1 for a in scraped_articles if a.get('word_count', 0) == 0)
+        word_counts = [a['word_count'] for a in successful]
+        total_words = sum(word_counts)
 
         quality_table = doc.add_table(rows=6, cols=3)
         quality_table.style = 'Medium Grid 3'
@@ -877,18 +1421,17 @@ class EnhancedDocumentGenerator:
             ["Metric", "Value", "Percentage"],
             ["Total Articles Attempted", str(len(scraped_articles)), "100%"],
             ["Successful Extractions", str(len(successful)), f"{len(successful)/max(len(scraped_articles), 1)*100:.1f}%"],
-            ["Failed Extractions", str(len(failed)), f"{len(failed)/max(len(scraped_articles), 1)*100:.1f}%"],
-            ["Average Words per Article", f"{sum(a.get('word_count', 0) for a in successful) // max(len(successful), 1)}", "N/A"],
-            ["Total Content Analyzed", f"{sum(a.get('word_count', 0) for a in successful):,} words", "N/A"]
+            ["Failed Extractions", str(failed_count), f"{failed_count/max(len(scraped_articles), 1)*100:.1f}%"],
+            ["Average Words per Article", f"{total_words // max(len(successful), 1)}", "N/A"],
+            ["Total Content Analyzed", f"{total_words:,} words", "N/A"]
         ]
 
-        for row_idx, row_data in enumerate(quality_data):
-            for col_idx, cell_data in enumerate(row_data):
-                cell = quality_table.rows[row_idx].cells[col_idx]
-                cell.text = cell_data
+        for row_idx, (row, row_data) in enumerate(zip(quality_table.rows, quality_data)):
+            for cell, cell_data in zip(row.cells, row_data):
                 if row_idx == 0:
-                    cell.paragraphs[0].runs[0].font.bold = True
-                    cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
+                    self._fast_cell(cell, cell_data, bold=True, align='center')
+                else:
+                    self._fast_cell(cell, cell_data)
 
         doc.add_paragraph("")
 
@@ -897,18 +1440,15 @@ class EnhancedDocumentGenerator:
 
         if successful:
             # Word count distribution
-            word_counts = [a.get('word_count', 0) for a in successful]
-
-            distribution_para = doc.add_paragraph()
+            shortest, longest, median, std_dev = _word_count_stats(word_counts)
             distribution_items = [
-                f"• Shortest Article: {min(word_counts):,} words",
-                f"• Longest Article: {max(word_counts):,} words",
-                f"• Median Length: {sorted(word_counts)[len(word_counts)//2]:,} words",
-                f"• Standard Deviation: {self._calculate_std_dev(word_counts):.1f} words"
+                f"• Shortest Article: {shortest:,} words",
+                f"• Longest Article: {longest:,} words",
+                f"• Median Length: {median:,} words",
+                f"• Standard Deviation: {std_dev:.1f} words"
             ]
 
-            for item in distribution_items:
-                distribution_para.add_run(item + "\n")
+            _insert_body_xml(doc, _lines_xml(distribution_items))
 
     def _add_source_credibility(self, doc, results):
         """Add source credibility analysis"""
@@ -920,16 +1460,8 @@ class EnhancedDocumentGenerator:
             articles = results['scrape_articles'].get('scraped_articles', [])
 
             # Extract domains
-            domains = {}
-            for article in articles:
-                url = article.get('url', '')
-                if url:
-                    try:
-                        from urllib.parse import urlparse
-                        domain = urlparse(url).netloc
-                        domains[domain] = domains.get(domain, 0) + 1
-                    except:
-                        pass
+            domains = Counter(m.group(1).lower() for a in articles
+                              if (m := _NETLOC_RE.match(a.get('url') or '')))
 
             if domains:
                 # Create source table
@@ -938,20 +1470,16 @@ class EnhancedDocumentGenerator:
 
                 # Headers
                 headers = ["Source Domain", "Articles", "Percentage"]
-                for i, header in enumerate(headers):
-                    cell = source_table.rows[0].cells[i]
-                    cell.text = header
-                    cell.paragraphs[0].runs[0].font.bold = True
-                    cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-                # Sort domains by count
-                sorted_domains = sorted(domains.items(), key=lambda x: x[1], reverse=True)
+                for cell, header in zip(source_table.rows[0].cells, headers):
+                    self._fast_cell(cell, header, bold=True, align='center')
+
                 total_articles = sum(domains.values())
 
-                for row_idx, (domain, count) in enumerate(sorted_domains, 1):
-                    source_table.rows[row_idx].cells[0].text = domain
-                    source_table.rows[row_idx].cells[1].text = str(count)
-                    source_table.rows[row_idx].cells[2].text = f"{count/total_articles*100:.1f}%"
+                for row, (domain, count) in zip(source_table.rows[1:], domains.most_common()):
+                    domain_cell, count_cell, share_cell = row.cells
+                    self._fast_cell(domain_cell, domain)
+                    self._fast_cell(count_cell, str(count))
+                    self._fast_cell(share_cell, f"{count/total_articles*100:.1f}%")
 
         doc.add_paragraph("")
 
@@ -978,7 +1506,7 @@ class EnhancedDocumentGenerator:
                         para.paragraph_format.line_spacing_rule = WD_LINE_SPACING.ONE_POINT_FIVE
                         para.paragraph_format.space_after = Pt(6)
 
-    def _add_appendices(self, doc, results):
+    def _add_appendices(self, doc, results, now):
         """Add technical appendices"""
         doc.add_page_break()
         doc.add_paragraph("TECHNICAL APPENDIX", style='Section Header')
@@ -991,49 +1519,32 @@ class EnhancedDocumentGenerator:
 
         # Headers
         headers = ["Tool", "Status", "Details"]
-        for i, header in enumerate(headers):
-            cell = execution_table.rows[0].cells[i]
-            cell.text = header
-            cell.paragraphs[0].runs[0].font.bold = True
-            cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
+        for cell, header in zip(execution_table.rows[0].cells, headers):
+            self._fast_cell(cell, header, bold=True, align='center')
 
         # Tool execution details
-        for row_idx, (tool_name, result) in enumerate(results.items(), 1):
-            execution_table.rows[row_idx].cells[0].text = tool_name
+        for row, (tool_name, result) in zip(execution_table.rows[1:], results.items()):
+            tool_cell, status_cell, details_cell = row.cells
+            self._fast_cell(tool_cell, tool_name)
 
             if result.get('success'):
-                status_cell = execution_table.rows[row_idx].cells[1]
-                status_cell.text = "✓ Success"
-                status_cell.paragraphs[0].runs[0].font.color.rgb = self.success_color
+                self._fast_cell(status_cell, "✓ Success", color=self.SUCCESS_COLOR)
             else:
-                status_cell = execution_table.rows[row_idx].cells[1]
-                status_cell.text = "✗ Failed"
-                status_cell.paragraphs[0].runs[0].font.color.rgb = self.error_color
+                self._fast_cell(status_cell, "✗ Failed", color=self.ERROR_COLOR)
 
             # Add relevant details
-            details = self._get_tool_details(tool_name, result)
-            execution_table.rows[row_idx].cells[2].text = details
+            self._fast_cell(details_cell, self._get_tool_details(tool_name, result))
 
         doc.add_paragraph("")
 
         # System Information
         doc.add_paragraph("System Information", style='Subsection')
 
-        system_info = doc.add_paragraph()
-        system_items = [
-            f"• Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            f"• Analysis Engine: {'GPT-4 Advanced' if client else 'Basic (No API Key)'}",
-            f"• Scraping Engine: BeautifulSoup 4",
-            f"• Search Provider: DuckDuckGo",
-            f"• Document Format: Microsoft Word (.docx)",
-            f"• Processing Pipeline: Automated Multi-Stage",
-            f"• Quality Assurance: Multi-Point Verification"
-        ]
-
-        for item in system_items:
-            system_info.add_run(item + "\n")
+        _insert_body_xml(doc, _SYSTEM_INFO_XML.format(
+            generated=escape(now.strftime(_APPENDIX_FMT)),
+            engine=escape(REPORT_MODEL if client else 'Basic (No API Key)')))
 
-    def _add_footer_headers(self, doc, original_request):
+    def _add_footer_headers(self, doc, original_request, now):
         """Add professional headers and footers"""
         section = doc.sections[0]
 
@@ -1043,15 +1554,29 @@ class EnhancedDocumentGenerator:
         header_para.text = f"News Analysis Report - {original_request[:50]}"
         header_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
         header_para.runs[0].font.size = Pt(10)
-        header_para.runs[0].font.color.rgb = RGBColor(128, 128, 128)
+        header_para.runs[0].font.color.rgb = self.MUTED_COLOR
 
         # Footer
         footer = section.footer
         footer_para = footer.paragraphs[0]
-        footer_para.text = f"Generated on {datetime.now().strftime('%B %d, %Y')} | Confidential Analysis Report | Page "
+        footer_para.text = f"Generated on {now.strftime(_FOOTER_FMT)} | Confidential Analysis Report | Page "
         footer_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
         footer_para.runs[0].font.size = Pt(9)
-        footer_para.runs[0].font.color.rgb = RGBColor(128, 128, 128)
+        footer_para.runs[0].font.color.rgb = self.MUTED_COLOR
+
+    def _fast_cell(self, cell, text, *, bold=False, size=None, color=None, align=None):
+        """Replace a table cell's content with one pre-built formatted paragraph.
+
+        Equivalent to setting cell.text and then styling runs[0], but builds the
+        <w:p> in a single parse instead of several python-docx property round-trips.
+        """
+        tc = cell._tc
+        for child in list(tc):
+            if child.tag != qn('w:tcPr'):
+                tc.remove(child)
+        tc.extend(_w_elements(_paragraph_xml(
+            _run_xml(text, bold=bold, size=size, color=color), align=align
+        )))
 
     def _add_highlight_box(self, doc, content):
         """Add a highlighted content box"""
@@ -1073,128 +1598,340 @@ class EnhancedDocumentGenerator:
     def _parse_report_content(self, report_content):
         """Parse report content into structured sections"""
         sections = []
-        current_section = ""
-        current_title = ""
-
-        lines = report_content.split('\n')
-
-        for line in lines:
-            # Check for markdown headers
-            if line.startswith('**') and line.endswith('**'):
-                if current_title or current_section:
-                    sections.append((current_title, current_section.strip()))
-                current_title = line.strip('*').strip()
-                current_section = ""
-            elif line.startswith('#'):
-                if current_title or current_section:
-                    sections.append((current_title, current_section.strip()))
-                current_title = line.strip('#').strip()
-                current_section = ""
-            else:
-                current_section += line + '\n'
+        # Trailing newline so every section slice ends in '\n', as the old line-by-line build did
+        text = report_content + '\n'
+        title, body_start = "", 0
 
-        if current_title or current_section:
-            sections.append((current_title, current_section.strip()))
+        for match in _REPORT_HEADER_RE.finditer(text):
+            body = text[body_start:match.start()]
+            if title or body:
+                sections.append((title, body.strip()))
+            title = match.group().strip('#' if match.group().startswith('#') else '*').strip()
+            body_start = match.end() + 1
 
-        return sections
+        body = text[body_start:]
+        if title or body:
+            sections.append((title, body.strip()))
 
-    def _calculate_std_dev(self, numbers):
-        """Calculate standard deviation"""
-        if not numbers:
-            return 0
-        mean = sum(numbers) / len(numbers)
-        variance = sum((x - mean) ** 2 for x in numbers) / len(numbers)
-        return variance ** 0.5
+        return sections
 
     def _get_tool_details(self, tool_name, result):
         """Get relevant details for each tool execution"""
-        details = ""
-
-        if tool_name == "search_news":
-            details = f"Found {result.get('count', 0)} articles"
-        elif tool_name == "scrape_articles":
-            details = f"Scraped {result.get('successful_scrapes', 0)}/{result.get('total_scraped', 0)} articles"
-        elif tool_name == "analyze_news":
-            details = f"Analyzed {result.get('articles_analyzed', 0)} articles"
-        elif tool_name == "generate_report":
-            details = f"Report with {result.get('articles_analyzed', 0)} sources"
-        elif tool_name == "generate_document":
-            details = f"Document: {result.get('document_path', 'N/A')}"
-        elif tool_name == "check_internet":
-            details = f"Status: {result.get('status', 'Unknown')}"
-        else:
-            details = "Completed" if result.get('success') else result.get('error', 'Failed')
-
-        return details
+        describe = self._TOOL_DETAILS.get(tool_name)
+        if describe is None:
+            return "Completed" if result.get('success') else result.get('error', 'Failed')
+        return describe(result)
 
 
 # ============================================
 # CONFIGURABLE NEWS AGENT
 # ============================================
 
+# A topic needs at least one letter or digit to be worth searching for
+_TOPIC_RE = re.compile(r"[^\W_]")
+
+# Completion message shown after a successful run
+_RESPONSE_TEMPLATE = """
+✅ **COMPREHENSIVE ANALYSIS COMPLETE**
+
+📄 **Professional Document Generated**: `{doc_result}`
+
+📊 **Analysis Summary:**
+• Articles Searched: {searched}
+• Articles Scraped: {scraped}
+• Successful Extractions: {successful}
+• Total Words Analyzed: {total_words:,}
+• AI Summaries Generated: {ai_summaries}
+
+📋 **Document Contents:**
+• Executive Dashboard with performance metrics
+• Table of Contents for easy navigation  
+• Key Findings and insights
+• Detailed Article Analysis ({report_detail} articles)
+• Statistical Analysis and data quality metrics
+• Source Credibility evaluation
+• Comprehensive AI-generated report
+• Technical appendix with execution details
+
+🎯 **Topic Analyzed**: "{topic}"
+
+✨ The document has been saved in your current directory and is ready for:
+• Executive presentations
+• Team sharing
+• Archive and reference
+• Further analysis
+
+Open the Word document to view the complete professional analysis report!
+"""
+
+
+@dataclass(frozen=True)
+class RunConfig:
+    """Validated article counts for one pipeline run"""
+    search: int  # articles to search for
+    scrape: int  # articles to scrape and summarize
+    report: int  # articles shown in the detailed report
+
+    @classmethod
+    def clamp(cls, search: int = 20, scrape: int = 15, report: int = None) -> "RunConfig":
+        """Counts pulled into the supported ranges; the report detail defaults to the scrape count"""
+        search = max(1, min(50, search))
+        scrape = max(1, min(30, scrape))
+        return cls(search, scrape, scrape if report is None else report)
+
+
+class _LRUDict(OrderedDict):
+    """dict that drops its least recently used entry once it holds more than `maxsize`.
+
+    Lookups, stores and evictions hold a lock: batch runs search from several threads at once.
+    """
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key):
+        with self._lock:
+            value = super().__getitem__(key)
+            self.move_to_end(key)
+            return value
+
+    def get(self, key, default=None):
+        # OrderedDict.get bypasses __getitem__, so hits would not count as a use
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            super().__setitem__(key, value)
+            self.move_to_end(key)
+            if len(self) > self.maxsize:
+                self.popitem(last=False)
+
+    def pop(self, key, *default):
+        with self._lock:
+            return super().pop(key, *default)
+
+
+class ResultCache:
+    """Finished pipeline results in a local SQLite file, keyed by topic and search/scrape sizes.
+
+    The file is only opened on first use, and close() can be called at any time: the next get/put
+    reopens it. If the file cannot be opened or written, the cache switches itself off.
+    """
+
+    def __init__(self, path: str = RESULT_CACHE_PATH, ttl: float = RESULT_CACHE_TTL):
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = None
+        self._disabled = False
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        """Open connection, connecting on first use; the caller holds _lock"""
+        if self._conn is None and not self._disabled:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            with self._conn:
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, created REAL, payload TEXT)")
+        return self._conn
+
+    def _disable(self, error: sqlite3.Error):
+        """Stop using the cache after an SQLite error; the caller holds _lock"""
+        print(f"⚠️ Result cache unavailable: {error}")
+        self._disabled = True
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def close(self):
+        """Close the SQLite connection, if one is open"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    @staticmethod
+    def key(topic: str, num_search_articles: int, num_scrape_articles: int) -> str:
+        """Case- and whitespace-insensitive key for a run"""
+        raw = f"{' '.join(topic.lower().split())}|{num_search_articles}|{num_scrape_articles}"
+        return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Cached results for key, or None if missing or older than the TTL"""
+        with self._lock:
+            try:
+                conn = self._connection()
+                row = conn and conn.execute("SELECT created, payload FROM results WHERE key = ?", (key,)).fetchone()
+            except sqlite3.Error as e:
+                self._disable(e)
+                return None
+        if row is None or time.time() - row[0] > self.ttl:
+            return None
+        return json.loads(row[1])
+
+    def put(self, key: str, results: Dict):
+        with self._lock:
+            try:
+                conn = self._connection()
+                if conn is not None:
+                    with conn:
+                        conn.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?)",
+                                     (key, time.time(), json.dumps(results)))
+            except sqlite3.Error as e:
+                self._disable(e)
+
+
+# One result cache per process, shared by every agent
+RESULT_CACHE = ResultCache()
+
+
 class ConfigurableNewsAgent:
     """Enhanced News Agent with configurable parameters for flexible analysis"""
 
-    def __init__(self):
+    def __init__(self, session: requests.Session = None, parse_pool: Executor = None):
+        # One connection pool for every HTTP tool, so keep-alive connections are shared between them
+        self.session = session or SESSION
+        # Optional process pool for HTML parsing, worth it when many pages are scraped at once
+        self.pool = parse_pool
         self.tools = {
             "check_internet": InternetConnectivityTool(),
             "search_news": NewsSearchTool(),
             "analyze_news": NewsAnalysisTool(),
-            "scrape_articles": WebScrapingTool(),
+            "scrape_articles": WebScrapingTool(session=self.session, parse_pool=self.pool),
             "generate_report": ReportGenerationTool(),
             "generate_document": EnhancedDocumentGenerator()
         }
+        self.result_cache = RESULT_CACHE
         self.memory = {
-            "conversation_history": [],
-            "cached_news": {},
-            "scraped_content": {},
-            "user_preferences": {}
+            "cached_news": _LRUDict(SEARCH_CACHE_SIZE),  # (query, max_results) -> (searched_at, search result)
+            "scraped_content": _LRUDict(SCRAPE_CACHE_SIZE)  # normalized URL -> (scraped_at, summarized article)
         }
         self.max_iterations = 20
+        # (checked_at, result) of the last successful connectivity check
+        self._connectivity = (0.0, None)
 
     def execute_with_config(self,
                             user_request: str,
                             num_search_articles: int = 20,
                             num_scrape_articles: int = 15,
-                            num_articles_in_report: int = None) -> str:
+                            num_articles_in_report: int = None,
+                            force_refresh: bool = False) -> str:
         """Execute news analysis with configurable parameters"""
-
-        # Validate inputs
-        num_search_articles = max(1, min(50, num_search_articles))
-        num_scrape_articles = max(1, min(30, num_scrape_articles))
-
-        if num_articles_in_report is None:
-            num_articles_in_report = num_scrape_articles
+        return asyncio.run(self.execute_with_config_async(
+            user_request, num_search_articles, num_scrape_articles, num_articles_in_report, force_refresh))
+
+    async def execute_with_config_async(self,
+                                        user_request: str,
+                                        num_search_articles: int = 20,
+                                        num_scrape_articles: int = 15,
+                                        num_articles_in_report: int = None,
+                                        force_refresh: bool = False) -> str:
+        """Async twin of execute_with_config: validate the sizes, then run_async"""
+        run = RunConfig.clamp(num_search_articles, num_scrape_articles, num_articles_in_report)
+        return await self.run_async(user_request, run, force_refresh)
+
+    async def run_async(self, user_request: str, run: RunConfig, force_refresh: bool = False) -> str:
+        """Pipeline for an already validated RunConfig; the report and analysis LLM calls run concurrently.
+
+        A finished run for the same topic and sizes is reused from the result cache, and recent searches
+        and scraped articles from memory; force_refresh bypasses all three and stores fresh results.
+        """
+
+        # Validate the topic; a bad one is rejected before any tool runs
+        user_request = " ".join((user_request or "").split())
+        if not _TOPIC_RE.search(user_request):
+            return "❌ Please enter a news topic containing letters or digits."
+
+        recent = None if force_refresh else self._recent_search(user_request, run.search)
+        if recent is not None and not recent.get("articles"):
+            return f"❌ Could not find articles about: {user_request}"
 
         print(f"🤖 Executing analysis with custom configuration:")
-        print(f"   📰 Search for: {num_search_articles} articles")
-        print(f"   🔍 Scrape: {num_scrape_articles} articles")
-        print(f"   📊 Report detail: {num_articles_in_report} articles")
+        print(f"   📰 Search for: {run.search} articles")
+        print(f"   🔍 Scrape: {run.scrape} articles")
+        print(f"   📊 Report detail: {run.report} articles")
         print("=" * 50)
 
         config = {
-            'max_search': num_search_articles,
-            'max_scrape': num_scrape_articles,
-            'max_articles_in_report': num_articles_in_report
+            'max_search': run.search,
+            'max_scrape': run.scrape,
+            'max_articles_in_report': run.report
         }
 
-        # Execute tools with configuration
+        cache_key = ResultCache.key(user_request, run.search, run.scrape)
+        results = None
+        if self.result_cache and not force_refresh:
+            results = self.result_cache.get(cache_key)
+        if results:
+            print("\n♻️ Reusing cached results for this topic (pass force_refresh=True or --refresh to re-run)")
+        else:
+            results = await self._collect_results(user_request, run.search, run.scrape, force_refresh)
+            if isinstance(results, str):
+                return results
+            # Only AI-backed runs with a report are cached; fallback output is redone once a key is set
+            if self.result_cache and client and results.get("generate_report", {}).get("success"):
+                self.result_cache.put(cache_key, results)
+
+        articles = results["search_news"].get("articles", [])
+        scraped_articles = results["scrape_articles"].get("scraped_articles", [])
+        successful_scrapes = results["scrape_articles"].get("successful_scrapes", 0)
+        total_words = results["scrape_articles"].get("total_words", 0)
+        ai_summaries = results["scrape_articles"].get("ai_summaries", 0)
+
+        # 6. Generate professional document
+        print(f"\n📄 Creating professional Word document...")
+        doc_result = await asyncio.to_thread(
+            self.tools["generate_document"].create_professional_document,
+            results=results,
+            original_request=user_request,
+            config=config
+        )
+
+        results["generate_document"] = {
+            "success": True if doc_result else False,
+            "document_path": doc_result
+        }
+
+        # Generate response
+        if doc_result:
+            response = _RESPONSE_TEMPLATE.format(
+                doc_result=doc_result,
+                searched=len(articles),
+                scraped=len(scraped_articles),
+                successful=successful_scrapes,
+                total_words=total_words,
+                ai_summaries=ai_summaries,
+                report_detail=run.report,
+                topic=user_request
+            )
+        else:
+            response = "❌ Failed to generate document. Please check the logs for details."
+
+        return response
+
+    async def _collect_results(self, user_request: str, num_search_articles: int,
+                               num_scrape_articles: int, force_refresh: bool = False):
+        """Run search, scrape, report and analysis; returns the results dict or an error message"""
         results = {}
 
-        # 1. Check internet
+        # 1. Check internet and 2. search for articles; the search starts alongside the
+        # connectivity probe and is only waited on once the connection is confirmed
         print("\n🌐 Checking internet connectivity...")
-        internet_result = self.tools["check_internet"].execute()
+        print(f"\n🔍 Searching for {num_search_articles} articles about: {user_request}")
+        search_task = asyncio.create_task(
+            asyncio.to_thread(self._search_news, user_request, num_search_articles, force_refresh))
+        internet_result = await asyncio.to_thread(self._check_internet)
         results["check_internet"] = internet_result
 
         if not internet_result.get("success"):
+            search_task.cancel()
             return "❌ No internet connection available. Please check your connection."
 
-        # 2. Search for articles
-        print(f"\n🔍 Searching for {num_search_articles} articles about: {user_request}")
-        search_result = self.tools["search_news"].execute(
-            query=user_request,
-            max_results=num_search_articles
-        )
+        search_result = await search_task
         results["search_news"] = search_result
 
         if not search_result.get("success") or not search_result.get("articles"):
@@ -1203,22 +1940,40 @@ class ConfigurableNewsAgent:
         articles = search_result.get("articles", [])
         print(f"✅ Found {len(articles)} articles")
 
+        # Analysis only needs the search results, so it runs in a worker thread while
+        # articles are scraped and summarized; each summary starts as soon as its page is in
+        print(f"\n🧠 Performing AI analysis...")
+        analyze_task = asyncio.create_task(asyncio.to_thread(
+            self.tools["analyze_news"].execute,
+            articles=articles,
+            max_articles=len(articles),  # one completion covers every search result
+            question=f"Provide key insights about: {user_request}"
+        ))
+
         # 3. Scrape articles
         print(f"\n📄 Scraping {num_scrape_articles} articles for full content...")
-        scrape_result = self.tools["scrape_articles"].execute(
-            articles=articles,
-            max_articles=num_scrape_articles
-        )
+        try:
+            scrape_result = await self.tools["scrape_articles"].execute_async(
+                articles=articles,
+                max_articles=num_scrape_articles,
+                keep_content=True,  # the document shows a content preview per article
+                cache=self.memory["scraped_content"],
+                refresh=force_refresh
+            )
+        except BaseException:
+            analyze_task.cancel()
+            raise
         results["scrape_articles"] = scrape_result
 
         scraped_articles = scrape_result.get("scraped_articles", [])
         successful_scrapes = scrape_result.get("successful_scrapes", 0)
         print(f"✅ Successfully scraped {successful_scrapes}/{len(scraped_articles)} articles")
 
-        # 4. Generate comprehensive report
+        # 4. Generate comprehensive report from the summaries, still overlapping 5. the analysis
         if successful_scrapes > 0:
             print(f"\n📊 Generating comprehensive report from {successful_scrapes} articles...")
-            report_result = self.tools["generate_report"].execute(
+            report_result = await asyncio.to_thread(
+                self.tools["generate_report"].execute,
                 scraped_articles=scraped_articles,
                 topic=user_request
             )
@@ -1227,65 +1982,36 @@ class ConfigurableNewsAgent:
             if report_result.get("success"):
                 print("✅ Report generated successfully")
 
-        # 5. Analyze articles (for additional insights)
-        print(f"\n🧠 Performing AI analysis...")
-        analyze_result = self.tools["analyze_news"].execute(
-            articles=articles[:5],
-            question=f"Provide key insights about: {user_request}"
-        )
+        analyze_result = await analyze_task
         results["analyze_news"] = analyze_result
 
-        # 6. Generate professional document
-        print(f"\n📄 Creating professional Word document...")
-        doc_result = self.tools["generate_document"].create_professional_document(
-            results=results,
-            original_request=user_request,
-            config=config
-        )
-
-        results["generate_document"] = {
-            "success": True if doc_result else False,
-            "document_path": doc_result
-        }
-
-        # Generate response
-        if doc_result:
-            response = f"""
-✅ **COMPREHENSIVE ANALYSIS COMPLETE**
-
-📄 **Professional Document Generated**: `{doc_result}`
-
-📊 **Analysis Summary:**
-• Articles Searched: {len(articles)}
-• Articles Scraped: {len(scraped_articles)}
-• Successful Extractions: {successful_scrapes}
-• Total Words Analyzed: {sum(a.get('word_count', 0) for a in scraped_articles):,}
-• AI Summaries Generated: {len([a for a in scraped_articles if a.get('ai_summary')])}
-
-📋 **Document Contents:**
-• Executive Dashboard with performance metrics
-• Table of Contents for easy navigation  
-• Key Findings and insights
-• Detailed Article Analysis ({num_articles_in_report} articles)
-• Statistical Analysis and data quality metrics
-• Source Credibility evaluation
-• Comprehensive AI-generated report
-• Technical appendix with execution details
-
-🎯 **Topic Analyzed**: "{user_request}"
-
-✨ The document has been saved in your current directory and is ready for:
-• Executive presentations
-• Team sharing
-• Archive and reference
-• Further analysis
-
-Open the Word document to view the complete professional analysis report!
-"""
-        else:
-            response = "❌ Failed to generate document. Please check the logs for details."
-
-        return response
+        return results
+
+    def _check_internet(self) -> Dict[str, Any]:
+        """Connectivity check, reusing a successful result for CONNECTIVITY_TTL seconds"""
+        checked_at, result = self._connectivity
+        if result is None or time.time() - checked_at > CONNECTIVITY_TTL:
+            result = self.tools["check_internet"].execute()
+            self._connectivity = (time.time(), result) if result.get("success") else (0.0, None)
+        return result
+
+    def _recent_search(self, query: str, max_results: int) -> Optional[Dict[str, Any]]:
+        """Successful search result for this query and size from the last SEARCH_TTL seconds, if any"""
+        entry = self.memory["cached_news"].get((query, max_results))
+        if entry is not None and time.time() - entry[0] <= SEARCH_TTL:
+            return entry[1]
+        return None
+
+    def _search_news(self, query: str, max_results: int, refresh: bool = False) -> Dict[str, Any]:
+        """News search, reusing a successful result (including an empty one) for SEARCH_TTL seconds unless refresh is set"""
+        result = None if refresh else self._recent_search(query, max_results)
+        if result is not None:
+            print("   ♻️ Reusing recent search results")
+            return result
+        result = self.tools["search_news"].execute(query=query, max_results=max_results)
+        if result.get("success"):
+            self.memory["cached_news"][(query, max_results)] = (time.time(), result)
+        return result
 
 
 # ============================================
@@ -1295,33 +2021,68 @@ Open the Word document to view the complete professional analysis report!
 def analyze_news(topic: str,
                  search_count: int = 20,
                  scrape_count: int = 15,
-                 report_detail: int = None):
-    """Simplified function to analyze news with custom parameters"""
+                 report_detail: int = None,
+                 force_refresh: bool = False):
+    """Simplified function to analyze news with custom parameters; force_refresh skips cached results"""
     agent = ConfigurableNewsAgent()
     return agent.execute_with_config(
         user_request=topic,
         num_search_articles=search_count,
         num_scrape_articles=scrape_count,
-        num_articles_in_report=report_detail
+        num_articles_in_report=report_detail,
+        force_refresh=force_refresh
     )
 
 
-def quick_news_report(topic: str):
+def quick_news_report(topic: str, force_refresh: bool = False):
     """Generate a quick news report with default settings"""
-    return analyze_news(topic, search_count=15, scrape_count=10, report_detail=5)
+    return analyze_news(topic, search_count=15, scrape_count=10, report_detail=5, force_refresh=force_refresh)
 
 
-def comprehensive_news_analysis(topic: str):
+def comprehensive_news_analysis(topic: str, force_refresh: bool = False):
     """Generate a comprehensive news analysis with maximum detail"""
-    return analyze_news(topic, search_count=30, scrape_count=20, report_detail=20)
+    return analyze_news(topic, search_count=30, scrape_count=20, report_detail=20, force_refresh=force_refresh)
+
+
+def batch_analyze(topics: List[str],
+                  concurrency: int = 4,
+                  search_count: int = 20,
+                  scrape_count: int = 15,
+                  report_detail: int = None,
+                  force_refresh: bool = False) -> List[str]:
+    """Analyze several topics, up to `concurrency` at a time, with one shared agent.
+
+    With several topics in flight page parsing is the CPU bottleneck, so it goes to a process pool.
+    force_refresh skips cached results for every topic.
+    """
+    config = RunConfig.clamp(search_count, scrape_count, report_detail)
+
+    async def run_all():
+        sem = asyncio.Semaphore(max(1, concurrency))
+
+        async def run(topic):
+            async with sem:
+                try:
+                    return await agent.run_async(topic, config, force_refresh)
+                except Exception as e:
+                    return f"❌ Analysis of '{topic}' failed: {e}"
+
+        return await asyncio.gather(*(run(t) for t in topics))
+
+    # forkserver (spawn where unavailable), not fork: this process already runs scrape, search and
+    # to_thread workers, and a lock held by one of them at fork time could deadlock a forked parser
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    with ProcessPoolExecutor(mp_context=multiprocessing.get_context(method)) as parse_pool:
+        agent = ConfigurableNewsAgent(parse_pool=parse_pool)
+        return asyncio.run(run_all())
 
 
 # ============================================
 # MAIN CLI INTERFACE
 # ============================================
 
-def interactive_news_analyzer():
-    """Interactive command-line interface for the news analyzer"""
+def interactive_news_analyzer(force_refresh: bool = False):
+    """Interactive command-line interface for the news analyzer; force_refresh skips cached results for every topic"""
     print("🤖 ENHANCED NEWS ANALYSIS SYSTEM")
     print("=" * 50)
     print("\nThis system can generate professional Word documents with:")
@@ -1330,6 +2091,9 @@ def interactive_news_analyzer():
     print("• Adjustable report detail level")
     print("\n" + "=" * 50)
 
+    # One agent for the whole session: tools, HTTP pool and in-memory caches carry over between topics
+    agent = ConfigurableNewsAgent()
+
     while True:
         try:
             print("\n📰 Enter your news topic (or 'quit' to exit):")
@@ -1357,14 +2121,21 @@ def interactive_news_analyzer():
             detail_input = input(f"Number of articles in detailed report (default {scrape_count}): ").strip()
             report_detail = int(detail_input) if detail_input else scrape_count
 
+            # Cached results are reused unless the user asks for fresh ones
+            refresh = force_refresh
+            if not refresh:
+                refresh_input = input("Ignore cached results and fetch fresh news? (y/N): ").strip().lower()
+                refresh = refresh_input in ("y", "yes")
+
             print("\n🚀 Starting analysis...")
             print("=" * 50)
 
-            result = analyze_news(
-                topic=topic,
-                search_count=search_count,
-                scrape_count=scrape_count,
-                report_detail=report_detail
+            result = agent.execute_with_config(
+                user_request=topic,
+                num_search_articles=search_count,
+                num_scrape_articles=scrape_count,
+                num_articles_in_report=report_detail,
+                force_refresh=refresh
             )
 
             print("\n" + "=" * 50)
@@ -1384,5 +2155,42 @@ def interactive_news_analyzer():
 # MAIN EXECUTION
 # ============================================
 
+def main():
+    """Entry point: interactive mode by default, or --batch FILE for a list of topics"""
+    parser = argparse.ArgumentParser(description="Search, scrape and summarize news into Word reports")
+    parser.add_argument("--batch", metavar="FILE",
+                        help="file with one topic per line ('-' reads stdin); skips the interactive prompts")
+    parser.add_argument("--concurrency", type=int, default=4, help="topics analyzed at once in batch mode")
+    parser.add_argument("--search", type=int, default=20, help="articles to search for per topic")
+    parser.add_argument("--scrape", type=int, default=15, help="articles to scrape per topic")
+    parser.add_argument("--detail", type=int, default=None, help="articles in each detailed report")
+    parser.add_argument("--refresh", action="store_true",
+                        help="ignore cached searches, scrapes and reports and fetch fresh news")
+    args = parser.parse_args()
+
+    try:
+        if not args.batch:
+            interactive_news_analyzer(args.refresh)
+            return
+
+        if args.batch == "-":
+            lines = sys.stdin.read().splitlines()
+        else:
+            with open(args.batch, encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        topics = [line.strip() for line in lines if line.strip() and not line.lstrip().startswith("#")]
+        if not topics:
+            parser.error("no topics found in batch input")
+
+        print(f"🚀 Analyzing {len(topics)} topics, {args.concurrency} at a time...")
+        results = batch_analyze(topics, args.concurrency, args.search, args.scrape, args.detail, args.refresh)
+        for topic, result in zip(topics, results):
+            print("\n" + "=" * 50)
+            print(f"📰 {topic}")
+            print(result)
+    finally:
+        RESULT_CACHE.close()
+
+
 if __name__ == "__main__":
-    interactive_news_analyzer()
\ No newline at end of file
+    main()
\ No newline at end of file